@@ -7,9 +7,109 @@ import pandas as pd
 import numpy as np
 import logging
 import json
+import re
 from datetime import datetime
 from pathlib import Path
 
+# Matches any whitespace run (newlines included) in text fields
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Minimum number of rows before the Numba text kernel is worth its JIT cost
+_NUMBA_MIN_ROWS = 500
+
+# Market columns to keep and their storage dtypes (adjust based on actual API response)
+_MARKET_DTYPES = {
+    'id': 'string',
+    'symbol': 'string',
+    'name': 'string',
+    'current_price': 'float64',
+    'market_cap': 'float64',
+    'total_volume': 'float64',
+    'price_change_24h': 'float64',
+    'price_change_percentage_24h': 'float64',
+    'high_24h': 'float64',
+    'low_24h': 'float64'
+}
+
+# Categorical dtype for the data_source metadata column
+_DATA_SOURCE_DTYPE = pd.CategoricalDtype(['market_api', 'news_api'])
+
+# News columns to keep, matching the news_data table (before name standardization)
+_NEWS_COLS = (
+    'title', 'description', 'content', 'author', 'publishedAt',
+    'source_id', 'source_name'
+)
+
+
+# Compiled whitespace kernel, or False if numba is unavailable; resolved on
+# first use so runs that never reach _NUMBA_MIN_ROWS skip the numba import
+_collapse_ws_kernel = None
+
+
+def _get_collapse_kernel():
+    """Compile the Numba whitespace kernel on first call (None if numba is missing)"""
+    global _collapse_ws_kernel
+    
+    if _collapse_ws_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:  # numba is optional; the regex path is used instead
+            _collapse_ws_kernel = False
+            return None
+        
+        @njit(parallel=True, cache=True)
+        def _collapse_ws(buf, offsets, out, out_lens):
+            """Collapse ASCII whitespace runs and trim each string in buf"""
+            for i in prange(len(offsets) - 1):
+                start = offsets[i]
+                pos = start
+                pending_space = False
+                for j in range(start, offsets[i + 1]):
+                    byte = buf[j]
+                    # Same ASCII set as the regex path's \s and str.strip()
+                    if byte == 32 or 9 <= byte <= 13 or 28 <= byte <= 31:
+                        # Only emit a separator once a non-space byte follows
+                        pending_space = pos > start
+                    else:
+                        if pending_space:
+                            out[pos] = 32
+                            pos += 1
+                            pending_space = False
+                        out[pos] = byte
+                        pos += 1
+                out_lens[i] = pos - start
+        
+        _collapse_ws_kernel = _collapse_ws
+    
+    return _collapse_ws_kernel or None
+
+
+def _collapse_whitespace_numba(kernel, values):
+    """
+    Collapse whitespace in a sequence of strings with the Numba kernel
+    
+    Args:
+        kernel (callable): Compiled kernel from _get_collapse_kernel
+        values (np.ndarray): Object array of ASCII str
+        
+    Returns:
+        list: Cleaned strings in the original order
+    """
+    encoded = [value.encode('ascii') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    out = np.empty_like(buf)
+    out_lens = np.empty(len(encoded), dtype=np.int64)
+    kernel(buf, offsets, out, out_lens)
+    
+    raw = out.tobytes()
+    return [
+        raw[start:start + length].decode('ascii')
+        for start, length in zip(offsets[:-1].tolist(), out_lens.tolist())
+    ]
+
 
 class DataCleaner:
     """Cleans and transforms raw data into structured format"""
@@ -17,6 +117,8 @@ class DataCleaner:
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self._date_fmt = config['date_format']
+        self._processed_path = Path(config['processed_data_path'])
     
     def clean_market_data(self, raw_data):
         """
@@ -30,39 +132,32 @@ class DataCleaner:
         """
         try:
             self.logger.info("Starting market data cleaning...")
+            fetch_timestamp = pd.Timestamp.now().floor('s')
             
-            # Convert to DataFrame
-            if isinstance(raw_data, list):
-                df = pd.DataFrame(raw_data)
-            else:
-                df = pd.DataFrame([raw_data])
+            # Convert to DataFrame, keeping only the relevant columns; explicit
+            # dtypes stop numeric columns falling back to object when values are missing
+            records = raw_data if isinstance(raw_data, list) else [raw_data]
+            df = pd.DataFrame.from_records(records, columns=list(_MARKET_DTYPES))
+            df = df.astype(_MARKET_DTYPES, errors='ignore')
             
             self.logger.info(f"Initial records: {len(df)}")
             
-            # Select relevant columns (adjust based on actual API response)
-            columns_to_keep = [
-                'id', 'symbol', 'name', 'current_price', 'market_cap',
-                'total_volume', 'price_change_24h', 'price_change_percentage_24h',
-                'high_24h', 'low_24h'
-            ]
-            
-            # Keep only existing columns
-            available_columns = [col for col in columns_to_keep if col in df.columns]
-            df = df[available_columns]
-            
             # Standardize column names
-            df.columns = df.columns.str.lower().str.replace(' ', '_')
+            df.rename(columns=lambda col: col.lower().replace(' ', '_'), inplace=True)
             
             # Handle missing values
             numeric_columns = df.select_dtypes(include=[np.number]).columns
-            df[numeric_columns] = df[numeric_columns].fillna(0)
+            df.fillna({col: 0 for col in numeric_columns}, inplace=True)
             
-            # Remove duplicates
-            df = df.drop_duplicates()
+            # Remove duplicates (id is the natural key; keep the latest entry)
+            if 'id' in df.columns:
+                df = df.drop_duplicates(subset=['id'], keep='last')
+            else:
+                df = df.drop_duplicates()
             
-            # Add metadata
-            df['fetch_timestamp'] = datetime.now().strftime(self.config['date_format'])
-            df['data_source'] = 'market_api'
+            # Add metadata (datetime64 / categorical; formatted as text on storage)
+            df['fetch_timestamp'] = fetch_timestamp
+            df['data_source'] = pd.Series('market_api', index=df.index, dtype=_DATA_SOURCE_DTYPE)
             
             # Data validation
             df = self._validate_market_data(df)
@@ -91,6 +186,7 @@ class DataCleaner:
         """
         try:
             self.logger.info("Starting news data cleaning...")
+            fetch_timestamp = pd.Timestamp.now().floor('s')
             
             # Extract articles from response
             if isinstance(raw_data, dict) and 'articles' in raw_data:
@@ -100,30 +196,25 @@ class DataCleaner:
             else:
                 articles = [raw_data]
             
-            df = pd.DataFrame(articles)
+            # Flatten nested 'source' dicts into source_id/source_name on load,
+            # then pin the fixed column set and order as object (text) columns
+            df = pd.json_normalize(articles, sep='_')
+            df = df.reindex(columns=_NEWS_COLS, fill_value='').astype(object)
             
             self.logger.info(f"Initial records: {len(df)}")
             
-            # Flatten nested 'source' column if exists
-            if 'source' in df.columns and isinstance(df['source'].iloc[0], dict):
-                df['source_id'] = df['source'].apply(lambda x: x.get('id', '') if isinstance(x, dict) else '')
-                df['source_name'] = df['source'].apply(lambda x: x.get('name', '') if isinstance(x, dict) else '')
-                df = df.drop('source', axis=1)
-            
             # Standardize column names
-            df.columns = df.columns.str.lower().str.replace(' ', '_')
+            df.rename(columns=lambda col: col.lower().replace(' ', '_'), inplace=True)
             
-            # Handle missing values
-            text_columns = df.select_dtypes(include=['object']).columns
-            df[text_columns] = df[text_columns].fillna('')
+            # Handle missing values (every kept column is text)
+            df.fillna('', inplace=True)
             
             # Remove duplicates based on title
-            if 'title' in df.columns:
-                df = df.drop_duplicates(subset=['title'])
+            df = df.drop_duplicates(subset=['title'])
             
-            # Add metadata
-            df['fetch_timestamp'] = datetime.now().strftime(self.config['date_format'])
-            df['data_source'] = 'news_api'
+            # Add metadata (datetime64 / categorical; formatted as text on storage)
+            df['fetch_timestamp'] = fetch_timestamp
+            df['data_source'] = pd.Series('news_api', index=df.index, dtype=_DATA_SOURCE_DTYPE)
             
             # Clean text fields
             df = self._clean_text_fields(df)
@@ -142,42 +233,58 @@ class DataCleaner:
     
     def _validate_market_data(self, df):
         """Validate market data quality"""
+        mask = pd.Series(True, index=df.index)
+        
         # Remove records with invalid prices
         if 'current_price' in df.columns:
-            df = df[df['current_price'] > 0]
+            mask &= df['current_price'] > 0
         
         # Remove records with negative market cap
         if 'market_cap' in df.columns:
-            df = df[df['market_cap'] >= 0]
+            mask &= df['market_cap'] >= 0
         
-        return df
+        return df.loc[mask]
     
     def _clean_text_fields(self, df):
         """Clean text fields in news data"""
         text_columns = ['title', 'description', 'content', 'author']
         
+        kernel = _get_collapse_kernel() if len(df) >= _NUMBA_MIN_ROWS else None
+        
         for col in text_columns:
-            if col in df.columns:
-                # Remove extra whitespace
-                df[col] = df[col].str.strip()
-                # Remove newlines
-                df[col] = df[col].str.replace('\n', ' ', regex=False)
-                # Remove multiple spaces
-                df[col] = df[col].str.replace(r'\s+', ' ', regex=True)
+            values = df[col].to_numpy(dtype=object)
+            # The kernel only knows ASCII whitespace; columns with any
+            # non-ASCII text (e.g. NBSP) take the Unicode-aware regex path
+            if (kernel is not None
+                    and pd.api.types.infer_dtype(values, skipna=False) == 'string'
+                    and all(value.isascii() for value in values)):
+                df[col] = _collapse_whitespace_numba(kernel, values)
+                continue
+            
+            # Collapse newlines and repeated spaces, then trim the ends
+            df[col] = df[col].str.replace(_WHITESPACE_RE, ' ', regex=True).str.strip()
         
         return df
     
     def _save_processed_data(self, df, filename):
-        """Save processed data to CSV"""
+        """Save processed data as Parquet (default) or CSV"""
+        processed_format = self.config.get('processed_format', 'parquet')
+        if processed_format not in ('parquet', 'csv'):
+            raise ValueError(f"Unsupported processed_format: {processed_format!r}")
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        processed_path = Path(self.config['processed_data_path'])
+        processed_path = self._processed_path
         
         # Ensure directory exists
         processed_path.mkdir(parents=True, exist_ok=True)
         
-        output_path = processed_path / f"{filename}_{timestamp}.csv"
+        output_path = processed_path / f"{filename}_{timestamp}.{processed_format}"
+        
+        if processed_format == 'parquet':
+            df.to_parquet(output_path, compression='zstd', index=False)
+        else:
+            df.to_csv(output_path, index=False)
         
-        df.to_csv(output_path, index=False)
         self.logger.info(f"Processed data saved to: {output_path}")
     
     def merge_datasets(self, market_df, news_df):
@@ -202,7 +309,7 @@ class DataCleaner:
                     'total_articles': len(news_df),
                     'unique_sources': int(news_df['source_name'].nunique()) if 'source_name' in news_df.columns else 0
                 },
-                'timestamp': datetime.now().strftime(self.config['date_format'])
+                'timestamp': datetime.now().strftime(self._date_fmt)
             }
             
             self.logger.info("Datasets merged successfully")
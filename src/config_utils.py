@@ -0,0 +1,38 @@
+"""
+Configuration Utilities
+Cached loading of the pipeline configuration file
+"""
+
+import copy
+import json
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+
+@lru_cache(maxsize=4)
+def _load_config(path):
+    """Read and parse a configuration file (cached per path)"""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def load_config(config_path):
+    """
+    Load pipeline configuration
+    
+    The file is parsed once per resolved path (so a relative path read
+    from another working directory is not served from the cache); each
+    caller receives its own copy so mutations do not leak into the cache.
+    
+    Args:
+        config_path (str): Path to configuration file
+        
+    Returns:
+        dict: Configuration settings
+    """
+    return copy.deepcopy(_load_config(str(Path(config_path).resolve())))
@@ -4,9 +4,6 @@ Demonstrates the pipeline without requiring external API calls
 """
 
 import logging
-import json
-import sys
-from pathlib import Path
 from datetime import datetime
 import pandas as pd
 
@@ -15,180 +12,188 @@ from fetch_data import DataFetcher
 from clean_data import DataCleaner
 from store_data import DataStorage
 from generate_report import ReportGenerator
+from config_utils import load_config
+from logging_utils import setup_logging
+
+
+# Static mock market snapshot, copied per call by create_mock_market_data
+_MOCK_MARKET_DATA = (
+    {
+        'id': 'bitcoin',
+        'symbol': 'btc',
+        'name': 'Bitcoin',
+        'current_price': 98456.78,
+        'market_cap': 1923456789012,
+        'total_volume': 45678901234,
+        'price_change_24h': 2345.67,
+        'price_change_percentage_24h': 2.44,
+        'high_24h': 99123.45,
+        'low_24h': 96234.56
+    },
+    {
+        'id': 'ethereum',
+        'symbol': 'eth',
+        'name': 'Ethereum',
+        'current_price': 3678.90,
+        'market_cap': 456789012345,
+        'total_volume': 23456789012,
+        'price_change_24h': -45.67,
+        'price_change_percentage_24h': -1.23,
+        'high_24h': 3734.56,
+        'low_24h': 3645.23
+    },
+    {
+        'id': 'binancecoin',
+        'symbol': 'bnb',
+        'name': 'Binance Coin',
+        'current_price': 612.34,
+        'market_cap': 94567890123,
+        'total_volume': 2345678901,
+        'price_change_24h': 15.67,
+        'price_change_percentage_24h': 2.63,
+        'high_24h': 618.90,
+        'low_24h': 598.45
+    },
+    {
+        'id': 'cardano',
+        'symbol': 'ada',
+        'name': 'Cardano',
+        'current_price': 1.23,
+        'market_cap': 43456789012,
+        'total_volume': 1234567890,
+        'price_change_24h': 0.05,
+        'price_change_percentage_24h': 4.23,
+        'high_24h': 1.28,
+        'low_24h': 1.18
+    },
+    {
+        'id': 'solana',
+        'symbol': 'sol',
+        'name': 'Solana',
+        'current_price': 234.56,
+        'market_cap': 123456789012,
+        'total_volume': 4567890123,
+        'price_change_24h': 8.90,
+        'price_change_percentage_24h': 3.94,
+        'high_24h': 238.45,
+        'low_24h': 228.67
+    },
+    {
+        'id': 'ripple',
+        'symbol': 'xrp',
+        'name': 'XRP',
+        'current_price': 0.87,
+        'market_cap': 45678901234,
+        'total_volume': 2345678901,
+        'price_change_24h': -0.03,
+        'price_change_percentage_24h': -3.33,
+        'high_24h': 0.91,
+        'low_24h': 0.85
+    },
+    {
+        'id': 'polkadot',
+        'symbol': 'dot',
+        'name': 'Polkadot',
+        'current_price': 12.34,
+        'market_cap': 15678901234,
+        'total_volume': 890123456,
+        'price_change_24h': 0.56,
+        'price_change_percentage_24h': 4.76,
+        'high_24h': 12.67,
+        'low_24h': 11.89
+    },
+    {
+        'id': 'dogecoin',
+        'symbol': 'doge',
+        'name': 'Dogecoin',
+        'current_price': 0.15,
+        'market_cap': 21234567890,
+        'total_volume': 1456789012,
+        'price_change_24h': 0.01,
+        'price_change_percentage_24h': 7.14,
+        'high_24h': 0.16,
+        'low_24h': 0.14
+    },
+    {
+        'id': 'avalanche',
+        'symbol': 'avax',
+        'name': 'Avalanche',
+        'current_price': 45.67,
+        'market_cap': 17890123456,
+        'total_volume': 789012345,
+        'price_change_24h': -1.23,
+        'price_change_percentage_24h': -2.62,
+        'high_24h': 47.34,
+        'low_24h': 44.56
+    },
+    {
+        'id': 'chainlink',
+        'symbol': 'link',
+        'name': 'Chainlink',
+        'current_price': 23.45,
+        'market_cap': 13456789012,
+        'total_volume': 678901234,
+        'price_change_24h': 0.89,
+        'price_change_percentage_24h': 3.94,
+        'high_24h': 24.12,
+        'low_24h': 22.67
+    }
+)
+
+# Static mock articles; publishedAt is stamped by create_mock_news_data
+_MOCK_NEWS_ARTICLES = (
+    {
+        'source': {'id': 'bloomberg', 'name': 'Bloomberg'},
+        'author': 'Sarah Chen',
+        'title': 'Bitcoin Surges Past $98,000 as Institutional Adoption Accelerates',
+        'description': 'Cryptocurrency markets show strong momentum with major institutional investments',
+        'content': 'Bitcoin reached new heights today as major financial institutions announced increased crypto allocations...'
+    },
+    {
+        'source': {'id': 'reuters', 'name': 'Reuters'},
+        'author': 'Michael Roberts',
+        'title': 'Federal Reserve Maintains Interest Rates Amid Economic Uncertainty',
+        'description': 'Central bank holds rates steady as economic indicators show mixed signals',
+        'content': 'The Federal Reserve announced today that it would maintain current interest rate levels...'
+    },
+    {
+        'source': {'id': 'wsj', 'name': 'Wall Street Journal'},
+        'author': 'Jennifer Martinez',
+        'title': 'Tech Stocks Rally on Strong Earnings Reports',
+        'description': 'Major technology companies exceed analyst expectations in Q4 earnings',
+        'content': 'Leading technology firms reported better-than-expected quarterly results...'
+    },
+    {
+        'source': {'id': 'cnbc', 'name': 'CNBC'},
+        'author': 'David Thompson',
+        'title': 'Ethereum Upgrade Promises Faster Transactions and Lower Fees',
+        'description': 'Network improvements aim to enhance scalability and user experience',
+        'content': 'The Ethereum network is set to implement major upgrades that will significantly improve performance...'
+    },
+    {
+        'source': {'id': 'ft', 'name': 'Financial Times'},
+        'author': 'Emma Wilson',
+        'title': 'Global Markets Show Resilience Amid Geopolitical Tensions',
+        'description': 'Investor sentiment remains cautiously optimistic despite ongoing challenges',
+        'content': 'International financial markets demonstrated unexpected strength today...'
+    }
+)
 
 
 def create_mock_market_data():
     """Generate realistic mock market data"""
-    return [
-        {
-            'id': 'bitcoin',
-            'symbol': 'btc',
-            'name': 'Bitcoin',
-            'current_price': 98456.78,
-            'market_cap': 1923456789012,
-            'total_volume': 45678901234,
-            'price_change_24h': 2345.67,
-            'price_change_percentage_24h': 2.44,
-            'high_24h': 99123.45,
-            'low_24h': 96234.56
-        },
-        {
-            'id': 'ethereum',
-            'symbol': 'eth',
-            'name': 'Ethereum',
-            'current_price': 3678.90,
-            'market_cap': 456789012345,
-            'total_volume': 23456789012,
-            'price_change_24h': -45.67,
-            'price_change_percentage_24h': -1.23,
-            'high_24h': 3734.56,
-            'low_24h': 3645.23
-        },
-        {
-            'id': 'binancecoin',
-            'symbol': 'bnb',
-            'name': 'Binance Coin',
-            'current_price': 612.34,
-            'market_cap': 94567890123,
-            'total_volume': 2345678901,
-            'price_change_24h': 15.67,
-            'price_change_percentage_24h': 2.63,
-            'high_24h': 618.90,
-            'low_24h': 598.45
-        },
-        {
-            'id': 'cardano',
-            'symbol': 'ada',
-            'name': 'Cardano',
-            'current_price': 1.23,
-            'market_cap': 43456789012,
-            'total_volume': 1234567890,
-            'price_change_24h': 0.05,
-            'price_change_percentage_24h': 4.23,
-            'high_24h': 1.28,
-            'low_24h': 1.18
-        },
-        {
-            'id': 'solana',
-            'symbol': 'sol',
-            'name': 'Solana',
-            'current_price': 234.56,
-            'market_cap': 123456789012,
-            'total_volume': 4567890123,
-            'price_change_24h': 8.90,
-            'price_change_percentage_24h': 3.94,
-            'high_24h': 238.45,
-            'low_24h': 228.67
-        },
-        {
-            'id': 'ripple',
-            'symbol': 'xrp',
-            'name': 'XRP',
-            'current_price': 0.87,
-            'market_cap': 45678901234,
-            'total_volume': 2345678901,
-            'price_change_24h': -0.03,
-            'price_change_percentage_24h': -3.33,
-            'high_24h': 0.91,
-            'low_24h': 0.85
-        },
-        {
-            'id': 'polkadot',
-            'symbol': 'dot',
-            'name': 'Polkadot',
-            'current_price': 12.34,
-            'market_cap': 15678901234,
-            'total_volume': 890123456,
-            'price_change_24h': 0.56,
-            'price_change_percentage_24h': 4.76,
-            'high_24h': 12.67,
-            'low_24h': 11.89
-        },
-        {
-            'id': 'dogecoin',
-            'symbol': 'doge',
-            'name': 'Dogecoin',
-            'current_price': 0.15,
-            'market_cap': 21234567890,
-            'total_volume': 1456789012,
-            'price_change_24h': 0.01,
-            'price_change_percentage_24h': 7.14,
-            'high_24h': 0.16,
-            'low_24h': 0.14
-        },
-        {
-            'id': 'avalanche',
-            'symbol': 'avax',
-            'name': 'Avalanche',
-            'current_price': 45.67,
-            'market_cap': 17890123456,
-            'total_volume': 789012345,
-            'price_change_24h': -1.23,
-            'price_change_percentage_24h': -2.62,
-            'high_24h': 47.34,
-            'low_24h': 44.56
-        },
-        {
-            'id': 'chainlink',
-            'symbol': 'link',
-            'name': 'Chainlink',
-            'current_price': 23.45,
-            'market_cap': 13456789012,
-            'total_volume': 678901234,
-            'price_change_24h': 0.89,
-            'price_change_percentage_24h': 3.94,
-            'high_24h': 24.12,
-            'low_24h': 22.67
-        }
-    ]
+    return [record.copy() for record in _MOCK_MARKET_DATA]
 
 
 def create_mock_news_data():
     """Generate realistic mock news data"""
+    now_iso = datetime.now().isoformat()
+    
     return {
         'status': 'ok',
-        'totalResults': 5,
+        'totalResults': len(_MOCK_NEWS_ARTICLES),
         'articles': [
-            {
-                'source': {'id': 'bloomberg', 'name': 'Bloomberg'},
-                'author': 'Sarah Chen',
-                'title': 'Bitcoin Surges Past $98,000 as Institutional Adoption Accelerates',
-                'description': 'Cryptocurrency markets show strong momentum with major institutional investments',
-                'publishedAt': datetime.now().isoformat(),
-                'content': 'Bitcoin reached new heights today as major financial institutions announced increased crypto allocations...'
-            },
-            {
-                'source': {'id': 'reuters', 'name': 'Reuters'},
-                'author': 'Michael Roberts',
-                'title': 'Federal Reserve Maintains Interest Rates Amid Economic Uncertainty',
-                'description': 'Central bank holds rates steady as economic indicators show mixed signals',
-                'publishedAt': datetime.now().isoformat(),
-                'content': 'The Federal Reserve announced today that it would maintain current interest rate levels...'
-            },
-            {
-                'source': {'id': 'wsj', 'name': 'Wall Street Journal'},
-                'author': 'Jennifer Martinez',
-                'title': 'Tech Stocks Rally on Strong Earnings Reports',
-                'description': 'Major technology companies exceed analyst expectations in Q4 earnings',
-                'publishedAt': datetime.now().isoformat(),
-                'content': 'Leading technology firms reported better-than-expected quarterly results...'
-            },
-            {
-                'source': {'id': 'cnbc', 'name': 'CNBC'},
-                'author': 'David Thompson',
-                'title': 'Ethereum Upgrade Promises Faster Transactions and Lower Fees',
-                'description': 'Network improvements aim to enhance scalability and user experience',
-                'publishedAt': datetime.now().isoformat(),
-                'content': 'The Ethereum network is set to implement major upgrades that will significantly improve performance...'
-            },
-            {
-                'source': {'id': 'ft', 'name': 'Financial Times'},
-                'author': 'Emma Wilson',
-                'title': 'Global Markets Show Resilience Amid Geopolitical Tensions',
-                'description': 'Investor sentiment remains cautiously optimistic despite ongoing challenges',
-                'publishedAt': datetime.now().isoformat(),
-                'content': 'International financial markets demonstrated unexpected strength today...'
-            }
+            {**article, 'publishedAt': now_iso} for article in _MOCK_NEWS_ARTICLES
         ]
     }
 
@@ -201,21 +206,10 @@ def run_demo_pipeline():
     print("=" * 80 + "\n")
     
     # Load configuration
-    with open('../config.json', 'r') as f:
-        config = json.load(f)
+    config = load_config('../config.json')
     
     # Setup logging
-    log_path = Path(config['log_path'])
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_path),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    setup_logging(config['log_path'])
     
     logger = logging.getLogger(__name__)
     
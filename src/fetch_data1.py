@@ -3,12 +3,74 @@ Data Fetching Module
 Handles API calls and raw data storage
 """
 
-import requests
+import asyncio
+import gzip
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
 
+# requests and pandas are imported where they are used so importing this
+# module (e.g. only for the mock data helpers) stays cheap
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+
+def _json_loads(raw):
+    """Parse JSON bytes with orjson when available"""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _json_dumps(data):
+    """Serialize data to compact JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _write_snapshot(output_path, data):
+    """Write a raw JSON snapshot gzip-compressed (level 1 favours speed)"""
+    with gzip.open(output_path, 'wb', compresslevel=1) as f:
+        f.write(_json_dumps(data))
+
+
+
+def _auth_headers(api_key):
+    """Bearer authorization headers for the news API (None without a key)"""
+    return {'Authorization': f'Bearer {api_key}'} if api_key else None
+
+
+# Static mock articles; publishedAt is stamped by _get_mock_news_data
+_MOCK_ARTICLES_SKELETON = (
+    {
+        "source": {"id": "mock-source", "name": "Mock News"},
+        "author": "Demo Author",
+        "title": "Market Analysis: Tech Stocks Rally",
+        "description": "Technology stocks showed strong performance today",
+        "publishedAt": None,
+        "content": "Full article content here"
+    },
+    {
+        "source": {"id": "mock-source-2", "name": "Financial Times"},
+        "author": "Finance Reporter",
+        "title": "Economic Indicators Point to Growth",
+        "description": "Latest economic data suggests positive trends",
+        "publishedAt": None,
+        "content": "Economic analysis content"
+    },
+    {
+        "source": {"id": "mock-source-3", "name": "Business Daily"},
+        "author": "Market Analyst",
+        "title": "Cryptocurrency Markets Stabilize",
+        "description": "Digital currencies show reduced volatility",
+        "publishedAt": None,
+        "content": "Crypto market analysis"
+    }
+)
+
 
 class DataFetcher:
     """Fetches data from external APIs and saves raw responses"""
@@ -16,7 +78,51 @@ class DataFetcher:
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self._raw_data_path = Path(config['raw_data_path'])
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         
+        # Pooled session so repeated fetches reuse keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            # Connect errors are not retried so an unreachable host fails
+            # within the connect timeout; read and 5xx failures still are
+            max_retries=Retry(total=3, connect=0, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # (connect, read) timeout: dead hosts fail fast, slow responses still complete
+        self._default_timeout = (3.05, 30)
+        
+        # News API credentials; headers are built once by set_api_key
+        self._api_key = None
+        self._news_headers = None
+    
+    def set_api_key(self, key):
+        """
+        Set the news API key used by fetch_news_data
+        
+        Args:
+            key (str): API key for news service, or None to use mock data
+        """
+        self._api_key = key
+        self._news_headers = _auth_headers(key)
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def fetch_api_data(self, url, output_filename, headers=None):
         """
         Fetch data from API and save to raw data folder
@@ -29,20 +135,21 @@ class DataFetcher:
         Returns:
             dict: Response data or None if failed
         """
+        import requests
+        
         try:
             self.logger.info(f"Fetching data from: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=self._default_timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             
             # Create output path with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = Path(self.config['raw_data_path']) / f"{output_filename}_{timestamp}.json"
+            output_path = self._raw_data_path / f"{output_filename}_{timestamp}.json.gz"
             
             # Save raw data
-            with open(output_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            _write_snapshot(output_path, data)
             
             self.logger.info(f"Data saved to: {output_path}")
             self.logger.info(f"Records fetched: {len(data) if isinstance(data, list) else 1}")
@@ -67,15 +174,40 @@ class DataFetcher:
             'market_data'
         )
     
+    def fetch_market_df(self):
+        """
+        Fetch market data straight into a DataFrame
+        
+        The orjson-parsed records are handed to DataFrame.from_records
+        without a JSON string round trip through pd.read_json.
+        
+        Returns:
+            pd.DataFrame: Raw market records, or None if the fetch failed
+        """
+        import pandas as pd
+        
+        data = self.fetch_market_data()
+        if data is None:
+            return None
+        
+        return pd.DataFrame.from_records(data if isinstance(data, list) else [data])
+    
     def fetch_news_data(self, api_key=None):
         """
         Fetch news data from configured endpoint
         
         Args:
-            api_key (str): API key for news service (if required)
+            api_key (str): API key for news service (if required); defaults
+                to the key given to set_api_key
         """
         self.logger.info("Starting news data fetch...")
-        headers = {'Authorization': f'Bearer {api_key}'} if api_key else None
+        
+        # A per-call key applies to this request only; the stored key is
+        # only changed by set_api_key
+        if api_key is not None:
+            headers = _auth_headers(api_key)
+        else:
+            api_key, headers = self._api_key, self._news_headers
         
         # For demo purposes, use a mock endpoint if no API key
         url = self.config['news_api_url']
@@ -85,44 +217,57 @@ class DataFetcher:
         
         return self.fetch_api_data(url, 'news_data', headers=headers)
     
+    async def fetch_market_data_async(self):
+        """Fetch market data without blocking the event loop"""
+        return await asyncio.to_thread(self.fetch_market_data)
+    
+    async def fetch_news_data_async(self, api_key=None):
+        """
+        Fetch news data without blocking the event loop
+        
+        Args:
+            api_key (str): API key for news service (if required)
+        """
+        return await asyncio.to_thread(self.fetch_news_data, api_key)
+    
+    async def fetch_all(self, api_key=None):
+        """
+        Fetch market and news data concurrently
+        
+        Both requests share the pooled session, so the two network waits
+        overlap instead of adding up.
+        
+        Args:
+            api_key (str): API key for news service (if required)
+            
+        Returns:
+            tuple: (market_data, news_data); either may be None if failed
+        """
+        market_data, news_data = await asyncio.gather(
+            self.fetch_market_data_async(),
+            self.fetch_news_data_async(api_key)
+        )
+        return market_data, news_data
+    
+    def run_all(self, api_key=None):
+        """Blocking wrapper around fetch_all"""
+        return asyncio.run(self.fetch_all(api_key))
+    
     def _get_mock_news_data(self):
         """Generate mock news data for demonstration"""
+        now_iso = datetime.now().isoformat()
         mock_data = {
             "status": "ok",
-            "totalResults": 3,
+            "totalResults": len(_MOCK_ARTICLES_SKELETON),
             "articles": [
-                {
-                    "source": {"id": "mock-source", "name": "Mock News"},
-                    "author": "Demo Author",
-                    "title": "Market Analysis: Tech Stocks Rally",
-                    "description": "Technology stocks showed strong performance today",
-                    "publishedAt": datetime.now().isoformat(),
-                    "content": "Full article content here"
-                },
-                {
-                    "source": {"id": "mock-source-2", "name": "Financial Times"},
-                    "author": "Finance Reporter",
-                    "title": "Economic Indicators Point to Growth",
-                    "description": "Latest economic data suggests positive trends",
-                    "publishedAt": datetime.now().isoformat(),
-                    "content": "Economic analysis content"
-                },
-                {
-                    "source": {"id": "mock-source-3", "name": "Business Daily"},
-                    "author": "Market Analyst",
-                    "title": "Cryptocurrency Markets Stabilize",
-                    "description": "Digital currencies show reduced volatility",
-                    "publishedAt": datetime.now().isoformat(),
-                    "content": "Crypto market analysis"
-                }
+                {**article, "publishedAt": now_iso} for article in _MOCK_ARTICLES_SKELETON
             ]
         }
         
         # Save mock data
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = Path(self.config['raw_data_path']) / f"news_data_{timestamp}.json"
-        with open(output_path, 'w') as f:
-            json.dump(mock_data, f, indent=2)
+        output_path = self._raw_data_path / f"news_data_{timestamp}.json.gz"
+        _write_snapshot(output_path, mock_data)
         
         self.logger.info(f"Mock news data saved to: {output_path}")
         return mock_data
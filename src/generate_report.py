@@ -3,10 +3,52 @@ Report Generation Module
 Creates summary reports and analytics
 """
 
-import pandas as pd
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
+from string import Template
+
+# pandas, numpy and pyarrow are imported inside the methods that use them
+# so importing this module stays cheap
+
+
+# Daily report skeleton; optional statistics blocks are rendered separately
+_REPORT_TEMPLATE = Template("""\
+${rule}
+DAILY MARKET & NEWS DATA REPORT
+${rule}
+
+Report Generated: ${generated}
+
+${section_rule}
+MARKET DATA SUMMARY
+${section_rule}
+
+Total Records: ${market_records}
+
+${market_sections}${section_rule}
+NEWS DATA SUMMARY
+${section_rule}
+
+Total Articles: ${news_articles}
+
+${news_sections}${rule}
+END OF REPORT
+${rule}
+""")
+
+
+def _write_file(path, data):
+    """Write bytes to path with raw os.write calls, bypassing the text-file layer"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may accept fewer bytes than requested
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 class ReportGenerator:
@@ -16,6 +58,7 @@ class ReportGenerator:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.reports_path = Path(config['reports_path'])
+        self._date_fmt = config['date_format']
         
         # Ensure reports directory exists
         self.reports_path.mkdir(parents=True, exist_ok=True)
@@ -30,40 +73,64 @@ class ReportGenerator:
         Returns:
             dict: Summary statistics
         """
+        import numpy as np
+        import pandas as pd
+        
         try:
             summary = {
-                'timestamp': datetime.now().strftime(self.config['date_format']),
+                'timestamp': datetime.now().strftime(self._date_fmt),
                 'total_records': len(df),
                 'columns': list(df.columns)
             }
             
-            # Calculate statistics for numeric columns
-            if 'current_price' in df.columns:
+            # Calculate statistics for numeric columns in a single aggregation
+            aggregations = {
+                'current_price': ['mean', 'median', 'min', 'max', 'std'],
+                'market_cap': ['sum', 'mean', 'max'],
+                'price_change_percentage_24h': ['mean']
+            }
+            aggregations = {col: funcs for col, funcs in aggregations.items() if col in df.columns}
+            stats = df.agg(aggregations) if aggregations else pd.DataFrame()
+            
+            if 'current_price' in aggregations:
                 summary['price_stats'] = {
-                    'average': float(df['current_price'].mean()),
-                    'median': float(df['current_price'].median()),
-                    'min': float(df['current_price'].min()),
-                    'max': float(df['current_price'].max()),
-                    'std': float(df['current_price'].std())
+                    'average': float(stats.at['mean', 'current_price']),
+                    'median': float(stats.at['median', 'current_price']),
+                    'min': float(stats.at['min', 'current_price']),
+                    'max': float(stats.at['max', 'current_price']),
+                    'std': float(stats.at['std', 'current_price'])
                 }
             
-            if 'market_cap' in df.columns:
+            if 'market_cap' in aggregations:
                 summary['market_cap_stats'] = {
-                    'total': float(df['market_cap'].sum()),
-                    'average': float(df['market_cap'].mean()),
-                    'top_coin_cap': float(df['market_cap'].max())
+                    'total': float(stats.at['sum', 'market_cap']),
+                    'average': float(stats.at['mean', 'market_cap']),
+                    'top_coin_cap': float(stats.at['max', 'market_cap'])
                 }
             
-            if 'price_change_percentage_24h' in df.columns:
+            if 'price_change_percentage_24h' in aggregations:
+                changes = df['price_change_percentage_24h'].to_numpy()
                 summary['price_change_stats'] = {
-                    'average_change': float(df['price_change_percentage_24h'].mean()),
-                    'gainers': int((df['price_change_percentage_24h'] > 0).sum()),
-                    'losers': int((df['price_change_percentage_24h'] < 0).sum())
+                    'average_change': float(stats.at['mean', 'price_change_percentage_24h']),
+                    'gainers': int((changes > 0).sum()),
+                    'losers': int((changes < 0).sum())
                 }
             
             # Top performers
             if 'name' in df.columns and 'current_price' in df.columns:
-                top_5 = df.nlargest(5, 'current_price')[['name', 'current_price', 'market_cap']]
+                # Partial selection (O(n)) instead of a full sort; missing prices rank last.
+                # Every row tied with the k-th price is kept, then ordered by price and
+                # row position so ties and missing prices resolve like nlargest(keep='first')
+                prices = df['current_price'].to_numpy(dtype='float64', na_value=-np.inf)
+                k = min(5, len(prices))
+                if k:
+                    kth = np.partition(prices, -k)[-k]
+                    top_idx = np.flatnonzero(prices >= kth)
+                    top_idx = top_idx[np.lexsort((top_idx, -prices[top_idx]))][:k]
+                else:
+                    top_idx = np.array([], dtype=np.intp)
+                
+                top_5 = df.iloc[top_idx][['name', 'current_price', 'market_cap']]
                 summary['top_5_by_price'] = top_5.to_dict('records')
             
             self.logger.info("Market summary generated successfully")
@@ -85,7 +152,7 @@ class ReportGenerator:
         """
         try:
             summary = {
-                'timestamp': datetime.now().strftime(self.config['date_format']),
+                'timestamp': datetime.now().strftime(self._date_fmt),
                 'total_articles': len(df),
                 'columns': list(df.columns)
             }
@@ -114,6 +181,52 @@ class ReportGenerator:
             self.logger.error(f"Error generating news summary: {str(e)}")
             return {}
     
+    def _render_market_sections(self, market_summary):
+        """Render the optional market statistics blocks of the daily report"""
+        sections = []
+        
+        if 'price_stats' in market_summary:
+            lines = [f"  {key.capitalize()}: ${value:,.2f}\n" for key, value in market_summary['price_stats'].items()]
+            sections.append("Price Statistics:\n" + "".join(lines) + "\n")
+        
+        if 'market_cap_stats' in market_summary:
+            lines = [
+                f"  {key.replace('_', ' ').capitalize()}: ${value:,.2f}\n"
+                for key, value in market_summary['market_cap_stats'].items()
+            ]
+            sections.append("Market Cap Statistics:\n" + "".join(lines) + "\n")
+        
+        if 'price_change_stats' in market_summary:
+            change_stats = market_summary['price_change_stats']
+            sections.append(
+                "24h Price Change:\n"
+                f"  Average Change: {change_stats['average_change']:.2f}%\n"
+                f"  Gainers: {change_stats['gainers']}\n"
+                f"  Losers: {change_stats['losers']}\n\n"
+            )
+        
+        if 'top_5_by_price' in market_summary:
+            lines = [
+                f"  {i}. {asset.get('name', 'N/A')}: ${asset.get('current_price', 0):,.2f}\n"
+                for i, asset in enumerate(market_summary['top_5_by_price'], 1)
+            ]
+            sections.append("Top 5 Assets by Price:\n" + "".join(lines) + "\n")
+        
+        return "".join(sections)
+    
+    def _render_news_sections(self, news_summary):
+        """Render the optional news blocks of the daily report"""
+        sections = []
+        
+        if 'sources' in news_summary:
+            sections.append(f"Unique Sources: {news_summary['sources'].get('unique_sources', 0)}\n\n")
+        
+        if 'recent_headlines' in news_summary:
+            lines = [f"  {i}. {headline}\n" for i, headline in enumerate(news_summary['recent_headlines'], 1)]
+            sections.append("Recent Headlines:\n" + "".join(lines) + "\n")
+        
+        return "".join(sections)
+    
     def create_daily_report(self, market_df, news_df, market_summary, news_summary):
         """
         Create comprehensive daily report
@@ -125,66 +238,20 @@ class ReportGenerator:
             news_summary (dict): News statistics
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             report_path = self.reports_path / f"daily_report_{timestamp}.txt"
             
-            with open(report_path, 'w') as f:
-                f.write("=" * 80 + "\n")
-                f.write("DAILY MARKET & NEWS DATA REPORT\n")
-                f.write("=" * 80 + "\n\n")
-                
-                f.write(f"Report Generated: {datetime.now().strftime(self.config['date_format'])}\n\n")
-                
-                # Market Data Section
-                f.write("-" * 80 + "\n")
-                f.write("MARKET DATA SUMMARY\n")
-                f.write("-" * 80 + "\n\n")
-                
-                f.write(f"Total Records: {market_summary.get('total_records', 0)}\n\n")
-                
-                if 'price_stats' in market_summary:
-                    f.write("Price Statistics:\n")
-                    for key, value in market_summary['price_stats'].items():
-                        f.write(f"  {key.capitalize()}: ${value:,.2f}\n")
-                    f.write("\n")
-                
-                if 'market_cap_stats' in market_summary:
-                    f.write("Market Cap Statistics:\n")
-                    for key, value in market_summary['market_cap_stats'].items():
-                        f.write(f"  {key.replace('_', ' ').capitalize()}: ${value:,.2f}\n")
-                    f.write("\n")
-                
-                if 'price_change_stats' in market_summary:
-                    f.write("24h Price Change:\n")
-                    f.write(f"  Average Change: {market_summary['price_change_stats']['average_change']:.2f}%\n")
-                    f.write(f"  Gainers: {market_summary['price_change_stats']['gainers']}\n")
-                    f.write(f"  Losers: {market_summary['price_change_stats']['losers']}\n\n")
-                
-                if 'top_5_by_price' in market_summary:
-                    f.write("Top 5 Assets by Price:\n")
-                    for i, asset in enumerate(market_summary['top_5_by_price'], 1):
-                        f.write(f"  {i}. {asset.get('name', 'N/A')}: ${asset.get('current_price', 0):,.2f}\n")
-                    f.write("\n")
-                
-                # News Data Section
-                f.write("-" * 80 + "\n")
-                f.write("NEWS DATA SUMMARY\n")
-                f.write("-" * 80 + "\n\n")
-                
-                f.write(f"Total Articles: {news_summary.get('total_articles', 0)}\n\n")
-                
-                if 'sources' in news_summary:
-                    f.write(f"Unique Sources: {news_summary['sources'].get('unique_sources', 0)}\n\n")
-                
-                if 'recent_headlines' in news_summary:
-                    f.write("Recent Headlines:\n")
-                    for i, headline in enumerate(news_summary['recent_headlines'], 1):
-                        f.write(f"  {i}. {headline}\n")
-                    f.write("\n")
-                
-                f.write("=" * 80 + "\n")
-                f.write("END OF REPORT\n")
-                f.write("=" * 80 + "\n")
+            rendered = _REPORT_TEMPLATE.substitute(
+                rule="=" * 80,
+                section_rule="-" * 80,
+                generated=now.strftime(self._date_fmt),
+                market_records=market_summary.get('total_records', 0),
+                market_sections=self._render_market_sections(market_summary),
+                news_articles=news_summary.get('total_articles', 0),
+                news_sections=self._render_news_sections(news_summary)
+            )
+            _write_file(report_path, rendered.encode('utf-8'))
             
             self.logger.info(f"Daily report saved to: {report_path}")
             return report_path
@@ -193,9 +260,47 @@ class ReportGenerator:
             self.logger.error(f"Error creating daily report: {str(e)}")
             return None
     
+    def _export_frame(self, df, name, timestamp):
+        """
+        Write a data export in the configured format
+        
+        Args:
+            df (pd.DataFrame): Data to export
+            name (str): Base file name
+            timestamp (str): File name timestamp suffix
+            
+        Returns:
+            Path: Path to the exported file
+        """
+        export_format = self.config.get('export_format', 'feather')
+        
+        if export_format == 'feather':
+            output_path = self.reports_path / f"{name}_{timestamp}.feather"
+            df.reset_index(drop=True).to_feather(output_path, compression='zstd')
+        elif export_format == 'parquet':
+            output_path = self.reports_path / f"{name}_{timestamp}.parquet"
+            df.to_parquet(output_path, compression='snappy', index=False)
+        elif export_format == 'csv':
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            
+            output_path = self.reports_path / f"{name}_{timestamp}.csv"
+            pacsv.write_csv(
+                pa.Table.from_pandas(df, preserve_index=False),
+                output_path,
+                write_options=pacsv.WriteOptions(batch_size=65536)
+            )
+        else:
+            raise ValueError(f"Unsupported export_format: {export_format!r}")
+        
+        return output_path
+    
     def export_to_csv(self, market_df, news_df):
         """
-        Export data to CSV files
+        Export data files and the summary CSV
+        
+        Market and news data are written as Feather by default; set
+        config['export_format'] to 'parquet' or 'csv' to change this.
         
         Args:
             market_df (pd.DataFrame): Market data
@@ -204,18 +309,18 @@ class ReportGenerator:
         Returns:
             tuple: Paths to exported files
         """
+        import pandas as pd
+        
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
             # Export market data
-            market_csv = self.reports_path / f"market_data_{timestamp}.csv"
-            market_df.to_csv(market_csv, index=False)
-            self.logger.info(f"Market data exported to: {market_csv}")
+            market_path = self._export_frame(market_df, 'market_data', timestamp)
+            self.logger.info(f"Market data exported to: {market_path}")
             
             # Export news data
-            news_csv = self.reports_path / f"news_data_{timestamp}.csv"
-            news_df.to_csv(news_csv, index=False)
-            self.logger.info(f"News data exported to: {news_csv}")
+            news_path = self._export_frame(news_df, 'news_data', timestamp)
+            self.logger.info(f"News data exported to: {news_path}")
             
             # Create summary CSV
             summary_csv = self.reports_path / f"daily_summary_{timestamp}.csv"
@@ -241,7 +346,7 @@ class ReportGenerator:
             summary_df.to_csv(summary_csv, index=False)
             self.logger.info(f"Summary exported to: {summary_csv}")
             
-            return market_csv, news_csv, summary_csv
+            return market_path, news_path, summary_csv
             
         except Exception as e:
             self.logger.error(f"Error exporting to CSV: {str(e)}")
@@ -251,6 +356,7 @@ class ReportGenerator:
 if __name__ == "__main__":
     # Test module independently
     import json
+    import pandas as pd
     
     with open('../config.json', 'r') as f:
         config = json.load(f)
@@ -0,0 +1,52 @@
+"""
+Logging Utilities
+Shared logging setup for the pipeline entry points
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+
+def setup_logging(log_path):
+    """
+    Attach file and console handlers to the root logger
+    
+    Handlers are only installed once per process, so creating several
+    pipelines (or running the demo after the main pipeline) does not
+    write every record multiple times.
+    
+    Args:
+        log_path (str): Path to the log file
+        
+    Returns:
+        bool: True if handlers were installed by this call
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return False
+    
+    log_path = Path(log_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Create formatter
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    
+    # File handler
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(formatter)
+    
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+    
+    root.setLevel(logging.INFO)
+    root.addHandler(file_handler)
+    root.addHandler(console_handler)
+    
+    return True
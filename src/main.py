@@ -3,17 +3,20 @@ Main Pipeline Orchestrator
 Coordinates the entire data pipeline execution
 """
 
+import asyncio
 import logging
-import json
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import pandas as pd
+
 # Import pipeline modules
 from fetch_data import DataFetcher
 from clean_data import DataCleaner
 from store_data import DataStorage
 from generate_report import ReportGenerator
+from config_utils import load_config
+from logging_utils import setup_logging
 
 
 class DataPipeline:
@@ -27,8 +30,7 @@ class DataPipeline:
             config_path (str): Path to configuration file
         """
         # Load configuration
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = load_config(config_path)
         
         # Setup logging
         self._setup_logging()
@@ -45,38 +47,54 @@ class DataPipeline:
     
     def _setup_logging(self):
         """Configure logging for the pipeline"""
-        log_path = Path(self.config['log_path'])
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path = self.config['log_path']
+        installed = setup_logging(log_path)
         
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        self.logger = logging.getLogger(__name__)
+        if installed:
+            self.logger.info(f"Logging initialized. Log file: {log_path}")
+    
+    def run(self, fetch_news=True, api_key=None):
+        """
+        Execute the complete data pipeline (blocking wrapper around run_async)
         
-        # File handler
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(formatter)
+        Args:
+            fetch_news (bool): Whether to fetch news data
+            api_key (str): API key for news service (optional)
+            
+        Returns:
+            dict: Pipeline execution summary
+        """
+        return asyncio.run(self.run_async(fetch_news=fetch_news, api_key=api_key))
+    
+    async def _fetch_and_clean(self, fetch, clean):
+        """
+        Await a fetch and clean its payload as soon as it arrives
         
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
+        Cleaning runs in a worker thread so it overlaps with the other
+        source's network wait.
         
-        # Configure root logger
-        logging.basicConfig(
-            level=logging.INFO,
-            handlers=[file_handler, console_handler]
-        )
+        Args:
+            fetch (coroutine): Fetcher coroutine returning raw data or None
+            clean (callable): Cleaner method turning raw data into a DataFrame
+            
+        Returns:
+            pd.DataFrame: Cleaned data, or None if the fetch failed
+        """
+        raw_data = await fetch
+        if raw_data is None:
+            return None
         
-        self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Logging initialized. Log file: {log_path}")
+        return await asyncio.to_thread(clean, raw_data)
     
-    def run(self, fetch_news=True, api_key=None):
+    async def run_async(self, fetch_news=True, api_key=None):
         """
         Execute the complete data pipeline
         
+        Market and news data are fetched concurrently and each payload is
+        cleaned as soon as it arrives; storage and reporting follow once
+        both sources are ready.
+        
         Args:
             fetch_news (bool): Whether to fetch news data
             api_key (str): API key for news service (optional)
@@ -84,9 +102,11 @@ class DataPipeline:
         Returns:
             dict: Pipeline execution summary
         """
+        date_fmt = self.config['date_format']
         start_time = datetime.now()
+        start_str = start_time.strftime(date_fmt)
         self.logger.info("\n" + "=" * 80)
-        self.logger.info(f"PIPELINE EXECUTION STARTED: {start_time.strftime(self.config['date_format'])}")
+        self.logger.info(f"PIPELINE EXECUTION STARTED: {start_str}")
         self.logger.info("=" * 80 + "\n")
         
         market_records = 0
@@ -95,69 +115,75 @@ class DataPipeline:
         error_message = None
         
         try:
-            # Step 1: Fetch Data
-            self.logger.info("STEP 1: Fetching data from APIs...")
+            # Steps 1-2: Fetch and clean data (sources overlap each other)
+            self.logger.info("STEP 1-2: Fetching and cleaning data...")
             self.logger.info("-" * 80)
             
-            market_data = self.fetcher.fetch_market_data()
-            if market_data is None:
-                raise Exception("Failed to fetch market data")
+            market_task = asyncio.create_task(self._fetch_and_clean(
+                self.fetcher.fetch_market_data_async(),
+                self.cleaner.clean_market_data
+            ))
             
-            news_data = None
+            news_task = None
             if fetch_news:
-                news_data = self.fetcher.fetch_news_data(api_key)
-                if news_data is None:
-                    self.logger.warning("Failed to fetch news data, continuing with market data only")
+                news_task = asyncio.create_task(self._fetch_and_clean(
+                    self.fetcher.fetch_news_data_async(api_key),
+                    self.cleaner.clean_news_data
+                ))
             
-            self.logger.info("✓ Data fetch completed\n")
-            
-            # Step 2: Clean Data
-            self.logger.info("STEP 2: Cleaning and transforming data...")
-            self.logger.info("-" * 80)
-            
-            market_df = self.cleaner.clean_market_data(market_data)
+            market_df = await market_task
+            if market_df is None:
+                raise Exception("Failed to fetch market data")
             market_records = len(market_df)
             
             news_df = None
-            if news_data:
-                news_df = self.cleaner.clean_news_data(news_data)
-                news_records = len(news_df)
-            
-            self.logger.info("✓ Data cleaning completed\n")
-            
-            # Step 3: Store Data
-            self.logger.info("STEP 3: Storing data to database...")
-            self.logger.info("-" * 80)
-            
-            self.storage.store_market_data(market_df)
-            
-            if news_df is not None:
-                self.storage.store_news_data(news_df)
+            if news_task is not None:
+                news_df = await news_task
+                if news_df is None:
+                    self.logger.warning("Failed to fetch news data, continuing with market data only")
+                else:
+                    news_records = len(news_df)
             
-            self.logger.info("✓ Data storage completed\n")
+            self.logger.info("✓ Data fetch and cleaning completed\n")
             
-            # Step 4: Generate Reports
-            self.logger.info("STEP 4: Generating reports and summaries...")
+            # Steps 3-4: Store data and generate reports (independent, run in parallel)
+            self.logger.info("STEP 3-4: Storing data and generating reports...")
             self.logger.info("-" * 80)
             
-            market_summary = self.reporter.generate_market_summary(market_df)
-            news_summary = self.reporter.generate_news_summary(news_df) if news_df is not None else {}
-            
-            # Create daily report
-            report_path = self.reporter.create_daily_report(
-                market_df, 
-                news_df if news_df is not None else pd.DataFrame(),
-                market_summary,
-                news_summary
-            )
-            
-            # Export to CSV
-            csv_files = self.reporter.export_to_csv(
-                market_df,
-                news_df if news_df is not None else pd.DataFrame()
-            )
-            
-            self.logger.info("✓ Report generation completed\n")
+            report_news_df = news_df if news_df is not None else pd.DataFrame()
+            loop = asyncio.get_running_loop()
+            
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                def submit(func, *args):
+                    return loop.run_in_executor(executor, func, *args)
+                
+                store_tasks = [submit(self.storage.store_market_data, market_df)]
+                if news_df is not None:
+                    store_tasks.append(submit(self.storage.store_news_data, news_df))
+                
+                # Export to CSV
+                export_task = submit(self.reporter.export_to_csv, market_df, report_news_df)
+                
+                market_summary_task = submit(self.reporter.generate_market_summary, market_df)
+                news_summary_task = None
+                if news_df is not None:
+                    news_summary_task = submit(self.reporter.generate_news_summary, news_df)
+                
+                market_summary = await market_summary_task
+                news_summary = await news_summary_task if news_summary_task is not None else {}
+                
+                # Create daily report once both summaries are ready
+                report_task = submit(
+                    self.reporter.create_daily_report,
+                    market_df,
+                    report_news_df,
+                    market_summary,
+                    news_summary
+                )
+                
+                report_path, csv_files, *_ = await asyncio.gather(report_task, export_task, *store_tasks)
+            
+            self.logger.info("✓ Data storage and report generation completed\n")
             
             # Pipeline completed successfully
             status = "SUCCESS"
@@ -171,8 +197,8 @@ class DataPipeline:
             # Create execution summary
             summary = {
                 'status': status,
-                'start_time': start_time.strftime(self.config['date_format']),
-                'end_time': end_time.strftime(self.config['date_format']),
+                'start_time': start_str,
+                'end_time': end_time.strftime(date_fmt),
                 'duration_seconds': duration,
                 'market_records_processed': market_records,
                 'news_records_processed': news_records,
@@ -183,6 +209,7 @@ class DataPipeline:
             
             # Log pipeline run to database
             self.storage.log_pipeline_run(status, market_records, news_records, error_message)
+            self.storage.flush()
             
             self.logger.info("=" * 80)
             self.logger.info("PIPELINE EXECUTION SUMMARY")
@@ -206,14 +233,15 @@ class DataPipeline:
             
             # Log failed run
             self.storage.log_pipeline_run(status, market_records, news_records, error_message)
+            self.storage.flush()
             
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
             
             summary = {
                 'status': status,
-                'start_time': start_time.strftime(self.config['date_format']),
-                'end_time': end_time.strftime(self.config['date_format']),
+                'start_time': start_str,
+                'end_time': end_time.strftime(date_fmt),
                 'duration_seconds': duration,
                 'error': error_message
             }
@@ -262,7 +290,7 @@ def main():
     pipeline = DataPipeline()
     
     # Run pipeline
-    summary = pipeline.run(fetch_news=True)
+    summary = asyncio.run(pipeline.run_async(fetch_news=True))
     
     # Display summary
     print("\n" + "=" * 80)
@@ -283,5 +311,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import pandas as pd  # Required for pipeline execution
     main()
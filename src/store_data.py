@@ -4,81 +4,142 @@ Handles database operations and data persistence
 """
 
 import sqlite3
+import threading
 import pandas as pd
 import logging
 from pathlib import Path
 from datetime import datetime
 
 
+# Insert column order for each data table, matching the DDL in _initialize_database
+_TABLE_COLUMNS = {
+    'market_data': (
+        'id', 'symbol', 'name', 'current_price', 'market_cap', 'total_volume',
+        'price_change_24h', 'price_change_percentage_24h', 'high_24h', 'low_24h',
+        'fetch_timestamp', 'data_source'
+    ),
+    'news_data': (
+        'title', 'description', 'author', 'content', 'source_id', 'source_name',
+        'publishedat', 'fetch_timestamp', 'data_source'
+    )
+}
+
+# Number of buffered pipeline runs that triggers a flush
+_RUN_LOG_BATCH_SIZE = 16
+
+# Connection tuning for append-heavy writes: WAL journal, fewer fsyncs,
+# in-memory temp tables, 256 MB mmap and a 64 MB page cache
+_SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536'
+)
+
+
 class DataStorage:
     """Manages data storage in SQLite database"""
     
     def __init__(self, config):
         self.config = config
         self.db_path = Path(config['database_path'])
+        self._date_fmt = config['date_format']
         self.logger = logging.getLogger(__name__)
         
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Long-lived connection shared by all operations; the lock serializes
+        # access when the pipeline stores market and news data concurrently
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        
+        # Pipeline runs waiting to be written by flush()
+        self._pending_runs = []
+        
         # Initialize database
         self._initialize_database()
     
+    def close(self):
+        """Flush pending pipeline runs and close the database connection"""
+        if self._conn is not None:
+            self.flush()
+            with self._lock:
+                self._conn.close()
+                self._conn = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def _initialize_database(self):
         """Create database and tables if they don't exist"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Create market_data table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS market_data (
-                    id TEXT,
-                    symbol TEXT,
-                    name TEXT,
-                    current_price REAL,
-                    market_cap REAL,
-                    total_volume REAL,
-                    price_change_24h REAL,
-                    price_change_percentage_24h REAL,
-                    high_24h REAL,
-                    low_24h REAL,
-                    fetch_timestamp TEXT,
-                    data_source TEXT,
-                    PRIMARY KEY (id, fetch_timestamp)
-                )
-            ''')
-            
-            # Create news_data table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS news_data (
-                    title TEXT,
-                    description TEXT,
-                    author TEXT,
-                    content TEXT,
-                    source_id TEXT,
-                    source_name TEXT,
-                    publishedat TEXT,
-                    fetch_timestamp TEXT,
-                    data_source TEXT,
-                    PRIMARY KEY (title, fetch_timestamp)
-                )
-            ''')
-            
-            # Create pipeline_metadata table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS pipeline_metadata (
-                    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    run_timestamp TEXT,
-                    status TEXT,
-                    market_records INTEGER,
-                    news_records INTEGER,
-                    error_message TEXT
-                )
-            ''')
-            
-            conn.commit()
-            conn.close()
+            with self._lock, self._conn:
+                cursor = self._conn.cursor()
+                
+                # Create market_data table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS market_data (
+                        id TEXT,
+                        symbol TEXT,
+                        name TEXT,
+                        current_price REAL,
+                        market_cap REAL,
+                        total_volume REAL,
+                        price_change_24h REAL,
+                        price_change_percentage_24h REAL,
+                        high_24h REAL,
+                        low_24h REAL,
+                        fetch_timestamp TEXT,
+                        data_source TEXT,
+                        PRIMARY KEY (id, fetch_timestamp)
+                    )
+                ''')
+            
+                # Create news_data table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS news_data (
+                        title TEXT,
+                        description TEXT,
+                        author TEXT,
+                        content TEXT,
+                        source_id TEXT,
+                        source_name TEXT,
+                        publishedat TEXT,
+                        fetch_timestamp TEXT,
+                        data_source TEXT,
+                        PRIMARY KEY (title, fetch_timestamp)
+                    )
+                ''')
+            
+                # Create pipeline_metadata table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS pipeline_metadata (
+                        run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        run_timestamp TEXT,
+                        status TEXT,
+                        market_records INTEGER,
+                        news_records INTEGER,
+                        error_message TEXT
+                    )
+                ''')
+                
+                # Indexes backing the ORDER BY ... DESC LIMIT n queries
+                cursor.executescript('''
+                    CREATE INDEX IF NOT EXISTS idx_market_data_fetch_timestamp
+                        ON market_data (fetch_timestamp);
+                    CREATE INDEX IF NOT EXISTS idx_news_data_fetch_timestamp
+                        ON news_data (fetch_timestamp);
+                    CREATE INDEX IF NOT EXISTS idx_pipeline_metadata_run_timestamp
+                        ON pipeline_metadata (run_timestamp);
+                ''')
+                
+                for pragma in _SQLITE_PRAGMAS:
+                    cursor.execute(pragma)
             
             self.logger.info(f"Database initialized at: {self.db_path}")
             
@@ -86,6 +147,45 @@ class DataStorage:
             self.logger.error(f"Database initialization error: {str(e)}")
             raise
     
+    def _format_timestamps(self, df):
+        """Render datetime fetch timestamps as text in the configured date format"""
+        if 'fetch_timestamp' in df.columns and pd.api.types.is_datetime64_any_dtype(df['fetch_timestamp']):
+            df = df.assign(fetch_timestamp=df['fetch_timestamp'].dt.strftime(self._date_fmt))
+        return df
+    
+    def _insert_rows(self, table, df, if_exists):
+        """
+        Bulk insert a DataFrame into a data table in one transaction
+        
+        Columns are written in table order; columns the table does not
+        have are ignored and missing ones are stored as NULL.
+        
+        Args:
+            table (str): Target table name
+            df (pd.DataFrame): Data to insert
+            if_exists (str): How to behave if table exists ('append', 'replace', 'fail')
+        """
+        if if_exists == 'fail':
+            raise ValueError(f"Table '{table}' already exists.")
+        if if_exists not in ('append', 'replace'):
+            raise ValueError(f"'{if_exists}' is not valid for if_exists")
+        
+        columns = [col for col in _TABLE_COLUMNS[table] if col in df.columns]
+        
+        # Python scalars with None for missing values, as sqlite3 expects
+        frame = self._format_timestamps(df)[columns].astype(object)
+        frame = frame.where(frame.notna(), None)
+        
+        insert_sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        
+        with self._lock, self._conn:
+            if if_exists == 'replace':
+                self._conn.execute(f"DELETE FROM {table}")
+            self._conn.executemany(insert_sql, frame.itertuples(index=False, name=None))
+    
     def store_market_data(self, df, if_exists='append'):
         """
         Store market data in database
@@ -97,9 +197,7 @@ class DataStorage:
         try:
             self.logger.info(f"Storing {len(df)} market records to database...")
             
-            conn = sqlite3.connect(self.db_path)
-            df.to_sql('market_data', conn, if_exists=if_exists, index=False)
-            conn.close()
+            self._insert_rows('market_data', df, if_exists)
             
             self.logger.info("Market data stored successfully")
             
@@ -118,9 +216,7 @@ class DataStorage:
         try:
             self.logger.info(f"Storing {len(df)} news records to database...")
             
-            conn = sqlite3.connect(self.db_path)
-            df.to_sql('news_data', conn, if_exists=if_exists, index=False)
-            conn.close()
+            self._insert_rows('news_data', df, if_exists)
             
             self.logger.info("News data stored successfully")
             
@@ -132,32 +228,45 @@ class DataStorage:
         """
         Log pipeline execution metadata
         
+        Runs are buffered and written in batches; call flush() (or close())
+        to persist pending runs immediately.
+        
         Args:
             status (str): Pipeline run status
             market_records (int): Number of market records processed
             news_records (int): Number of news records processed
             error_message (str): Error message if failed
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO pipeline_metadata 
-                (run_timestamp, status, market_records, news_records, error_message)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                datetime.now().strftime(self.config['date_format']),
+        with self._lock:
+            self._pending_runs.append((
+                datetime.now().strftime(self._date_fmt),
                 status,
                 market_records,
                 news_records,
                 error_message
             ))
-            
-            conn.commit()
-            conn.close()
-            
-            self.logger.info(f"Pipeline run logged with status: {status}")
+            pending = len(self._pending_runs)
+        
+        self.logger.info(f"Pipeline run logged with status: {status}")
+        
+        if pending >= _RUN_LOG_BATCH_SIZE:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered pipeline runs to the database in one transaction"""
+        try:
+            with self._lock:
+                if not self._pending_runs:
+                    return
+                
+                with self._conn:
+                    self._conn.executemany('''
+                        INSERT INTO pipeline_metadata 
+                        (run_timestamp, status, market_records, news_records, error_message)
+                        VALUES (?, ?, ?, ?, ?)
+                    ''', self._pending_runs)
+                
+                self._pending_runs.clear()
             
         except sqlite3.Error as e:
             self.logger.error(f"Error logging pipeline run: {str(e)}")
@@ -173,16 +282,14 @@ class DataStorage:
             pd.DataFrame: Query results
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            
-            query = f'''
+            query = '''
                 SELECT * FROM market_data 
                 ORDER BY fetch_timestamp DESC 
-                LIMIT {limit}
+                LIMIT ?
             '''
             
-            df = pd.read_sql_query(query, conn)
-            conn.close()
+            with self._lock:
+                df = pd.read_sql_query(query, self._conn, params=(limit,))
             
             return df
             
@@ -201,16 +308,14 @@ class DataStorage:
             pd.DataFrame: Query results
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            
-            query = f'''
+            query = '''
                 SELECT * FROM news_data 
                 ORDER BY fetch_timestamp DESC 
-                LIMIT {limit}
+                LIMIT ?
             '''
             
-            df = pd.read_sql_query(query, conn)
-            conn.close()
+            with self._lock:
+                df = pd.read_sql_query(query, self._conn, params=(limit,))
             
             return df
             
@@ -229,16 +334,16 @@ class DataStorage:
             pd.DataFrame: Pipeline run history
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            self.flush()
             
-            query = f'''
+            query = '''
                 SELECT * FROM pipeline_metadata 
                 ORDER BY run_timestamp DESC 
-                LIMIT {limit}
+                LIMIT ?
             '''
             
-            df = pd.read_sql_query(query, conn)
-            conn.close()
+            with self._lock:
+                df = pd.read_sql_query(query, self._conn, params=(limit,))
             
             return df
             
@@ -254,20 +359,19 @@ class DataStorage:
             dict: Database statistics
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Count records in each table
-            cursor.execute('SELECT COUNT(*) FROM market_data')
-            market_count = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM news_data')
-            news_count = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM pipeline_metadata')
-            pipeline_runs = cursor.fetchone()[0]
-            
-            conn.close()
+            self.flush()
+            
+            with self._lock:
+                cursor = self._conn.cursor()
+                
+                # Count records in each table in a single round trip
+                cursor.execute('''
+                    SELECT
+                        (SELECT COUNT(*) FROM market_data),
+                        (SELECT COUNT(*) FROM news_data),
+                        (SELECT COUNT(*) FROM pipeline_metadata)
+                ''')
+                market_count, news_count, pipeline_runs = cursor.fetchone()
             
             stats = {
                 'total_market_records': market_count,
@@ -309,3 +413,5 @@ if __name__ == "__main__":
     
     stats = storage.get_database_stats()
     print(f"Database stats: {stats}")
+    
+    storage.close()